@@ -1,10 +1,18 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
 
 from .models import Category, Location, Post
 
 admin.site.empty_value_display = 'Не задано'
 
 
+class BaseChangeList(ChangeList):
+    '''Список объектов, загружающий только отображаемые поля.'''
+    def get_results(self, request):
+        self.queryset = self.queryset.only('id', 'title', 'is_published')
+        super().get_results(request)
+
+
 class BaseAdmin(admin.ModelAdmin):
     list_display = (
         'title',
@@ -19,6 +27,10 @@ class BaseAdmin(admin.ModelAdmin):
     list_filter = (
         'is_published',
     )
+    list_per_page = 50
+
+    def get_changelist(self, request, **kwargs):
+        return BaseChangeList
 
 
 admin.site.register(Category, BaseAdmin)
@@ -0,0 +1,41 @@
+import time
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+POSTS_CACHE_TIMEOUT = 60
+POSTS_CACHE_VERSION_KEY = 'posts:version'
+
+
+def get_posts_cache_version():
+    '''Возвращает текущую версию кэша постов.'''
+    return cache.get_or_set(POSTS_CACHE_VERSION_KEY, time.time_ns, None)
+
+
+def get_posts_cache_key(path):
+    '''Возвращает ключ кэша страницы со списком постов.'''
+    return f'posts:{get_posts_cache_version()}:{path}'
+
+
+def invalidate_posts_cache():
+    '''Сбрасывает все закэшированные страницы со списками постов.'''
+    try:
+        cache.incr(POSTS_CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(POSTS_CACHE_VERSION_KEY, time.time_ns(), None)
+
+
+class CachedCountPaginator(Paginator):
+    '''Пагинатор, кэширующий количество объектов.'''
+    def __init__(self, *args, cache_key, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_key = cache_key
+
+    @cached_property
+    def count(self):
+        count = cache.get(self.cache_key)
+        if count is None:
+            count = super().count
+            cache.set(self.cache_key, count, POSTS_CACHE_TIMEOUT)
+        return count
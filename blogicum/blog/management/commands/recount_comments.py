@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, IntegerField, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from blog.models import Comment, Post
+
+
+class Command(BaseCommand):
+    help = 'Пересчитывает поле comment_count у всех постов.'
+
+    def handle(self, *args, **options):
+        comments_count = Subquery(
+            Comment.objects.filter(
+                post=OuterRef('pk')
+            ).order_by().values('post').annotate(
+                count=Count('*')
+            ).values('count'),
+            output_field=IntegerField(),
+        )
+        updated = Post.objects.update(
+            comment_count=Coalesce(comments_count, 0)
+        )
+        self.stdout.write(f'Обновлено постов: {updated}')
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.16 on 2026-10-14 15:33
+
+from django.db import migrations, models
+
+
+def fill_image_url(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    for post in Post.objects.exclude(image='').only('id', 'image').iterator():
+        Post.objects.filter(pk=post.pk).update(image_url=post.image.url)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0010_remove_post_ordering'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_url',
+            field=models.CharField(blank=True, editable=False, max_length=512, verbose_name='Адрес фото'),
+        ),
+        migrations.RunPython(fill_image_url, migrations.RunPython.noop),
+    ]
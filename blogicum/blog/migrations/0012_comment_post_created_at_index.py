@@ -0,0 +1,17 @@
+# Generated by Django 3.2.16 on 2026-10-14 15:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_post_image_url'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['post', 'created_at'], name='blog_commen_post_id_5fee65_idx'),
+        ),
+    ]
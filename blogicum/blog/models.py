@@ -5,6 +5,7 @@ User = get_user_model()
 TITLE_MAX_LENGTH = NAME_MAX_LENGTH = 256
 SELF_TITLE_LENGTH = SELF_NAME_LENGTH = 20
 COMMENT_SELF_TEXT_LEN = 25
+IMAGE_URL_MAX_LENGTH = 512
 
 
 class BaseModel(models.Model):
@@ -52,20 +53,51 @@ class Post(BaseModel):
         related_name='posts',
     )
     image = models.ImageField('Фото', upload_to='post_images', blank=True)
+    image_url = models.CharField(
+        verbose_name='Адрес фото',
+        max_length=IMAGE_URL_MAX_LENGTH,
+        blank=True,
+        editable=False,
+    )
     is_published = models.BooleanField(
         verbose_name='Опубликовано',
         default=True,
         help_text='Снимите галочку, чтобы скрыть публикацию.'
     )
+    comment_count = models.PositiveIntegerField(
+        verbose_name='Количество комментариев',
+        default=0,
+        editable=False,
+        db_index=True,
+    )
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
-        ordering = ['-pub_date']
+        indexes = [
+            models.Index(fields=['-pub_date']),
+            models.Index(fields=['is_published', '-pub_date']),
+            models.Index(fields=['author', '-pub_date']),
+            models.Index(fields=['category', '-pub_date']),
+        ]
 
     def __str__(self):
         return self.title[:SELF_TITLE_LENGTH]
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if 'image' not in self.get_deferred_fields() and (
+            update_fields is None or 'image' in update_fields
+        ):
+            # Адрес известен только после сохранения файла в хранилище,
+            # поэтому файл сохраняется до записи строки, как в pre_save.
+            if self.image and not self.image._committed:
+                self.image.save(self.image.name, self.image.file, save=False)
+            self.image_url = self.image.url if self.image else ''
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'image_url'}
+        super().save(*args, **kwargs)
+
 
 class Category(BaseModel):
     title = models.CharField(
@@ -90,6 +122,9 @@ class Category(BaseModel):
     class Meta:
         verbose_name = 'категория'
         verbose_name_plural = 'Категории'
+        indexes = [
+            models.Index(fields=['is_published', 'slug']),
+        ]
 
     def __str__(self):
         return self.title[:SELF_TITLE_LENGTH]
@@ -133,6 +168,9 @@ class Comment(BaseModel):
         verbose_name = 'комментарий'
         verbose_name_plural = 'Комментарии'
         ordering = ('created_at',)
+        indexes = [
+            models.Index(fields=['post', 'created_at']),
+        ]
 
     def __str__(self):
         return f'{self.author}: {self.text[:COMMENT_SELF_TEXT_LEN]}'
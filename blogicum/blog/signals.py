@@ -0,0 +1,46 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .caching import invalidate_posts_cache
+from .models import Category, Comment, Location, Post, User
+
+
+@receiver(post_save, sender=Comment)
+def increase_comment_count(sender, instance, created, **kwargs):
+    '''Увеличивает счётчик комментариев поста при создании комментария.'''
+    if created:
+        Post.objects.filter(pk=instance.post_id).update(
+            comment_count=F('comment_count') + 1
+        )
+
+
+@receiver(post_delete, sender=Comment)
+def decrease_comment_count(sender, instance, **kwargs):
+    '''Уменьшает счётчик комментариев поста при удалении комментария.'''
+    Post.objects.filter(
+        pk=instance.post_id,
+        comment_count__gt=0,
+    ).update(comment_count=F('comment_count') - 1)
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+@receiver(post_delete, sender=User)
+def clear_posts_cache(sender, **kwargs):
+    '''Сбрасывает кэш списков постов при изменении данных.'''
+    invalidate_posts_cache()
+
+
+@receiver(post_save, sender=User)
+def clear_posts_cache_on_user_change(sender, update_fields=None, **kwargs):
+    '''Сбрасывает кэш списков постов при изменении данных автора.'''
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_posts_cache()
@@ -1,6 +1,9 @@
+from http import HTTPStatus
+
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count
-from django.http import Http404
+from django.core.cache import cache
+from django.db.models import Prefetch
+from django.http import Http404, HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.utils import timezone
@@ -8,20 +11,48 @@ from django.views.generic import (
     CreateView, DeleteView, DetailView, ListView, UpdateView
 )
 
+from .caching import (
+    POSTS_CACHE_TIMEOUT,
+    CachedCountPaginator,
+    get_posts_cache_key,
+    get_posts_cache_version,
+)
 from .forms import CommentForm, PostForm
-from .models import Category, Comment, Post, User
+from .models import Category, Comment, Location, Post, User
 
 POSTS_COUNT = 10
 
 
 def get_ordered_posts_comments_count():
-    '''Функция для сортировки постов по дате с количеством комментариев.'''
+    '''Функция для сортировки постов по дате с количеством комментариев.
+
+    Количество комментариев хранится в поле Post.comment_count
+    и обновляется сигналами, поэтому агрегация не нужна.
+    '''
     return Post.objects.select_related(
         'author',
-        'location',
-        'category',
-    ).annotate(
-        comment_count=Count('comments')
+    ).prefetch_related(
+        Prefetch(
+            'category',
+            queryset=Category.objects.only(
+                'id', 'slug', 'title', 'is_published'
+            ),
+        ),
+        Prefetch(
+            'location',
+            queryset=Location.objects.only('id', 'name', 'is_published'),
+        ),
+    ).only(
+        'id',
+        'title',
+        'text',
+        'pub_date',
+        'image_url',
+        'is_published',
+        'comment_count',
+        'category_id',
+        'location_id',
+        'author__username',
     ).order_by('-pub_date')
 
 
@@ -34,18 +65,88 @@ def get_published_posts():
     )
 
 
-class PostListView(ListView):
+class AnonymousCacheMixin:
+    '''Миксин кэширования страницы для анонимных пользователей.'''
+    cache_timeout = POSTS_CACHE_TIMEOUT
+
+    def get_cache_page_number(self):
+        '''Возвращает номер страницы для ключа кэша или None.'''
+        page = self.request.GET.get(self.page_kwarg) or 1
+        if page == 'last':
+            return page
+        try:
+            return int(page)
+        except ValueError:
+            return None
+
+    def get(self, request, *args, **kwargs):
+        page = self.get_cache_page_number()
+        if request.user.is_authenticated or page is None:
+            return super().get(request, *args, **kwargs)
+        key = get_posts_cache_key(f'{request.path}?page={page}')
+        content = cache.get(key)
+        if content is not None:
+            return HttpResponse(content)
+        response = super().get(request, *args, **kwargs)
+        response.render()
+        if response.status_code == HTTPStatus.OK:
+            cache.set(key, response.content, self.cache_timeout)
+        return response
+
+
+class CachedCountMixin:
+    '''Миксин кэширования количества постов для пагинации.'''
+    paginator_class = CachedCountPaginator
+
+    def get_paginator(self, queryset, per_page, **kwargs):
+        return super().get_paginator(
+            queryset,
+            per_page,
+            cache_key=get_posts_cache_key(f'count:{self.request.path}'),
+            **kwargs,
+        )
+
+
+class PostCardsCacheMixin:
+    '''Миксин передачи в шаблон версии кэша карточек постов.'''
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['posts_cache_version'] = get_posts_cache_version()
+        return context
+
+
+class PostListView(
+    AnonymousCacheMixin,
+    CachedCountMixin,
+    PostCardsCacheMixin,
+    ListView,
+):
     '''CBV для главной страницы с постами.'''
-    queryset = get_published_posts()
     model = Post
     template_name = 'blog/index.html'
     paginate_by = POSTS_COUNT
 
+    def get_queryset(self):
+        return get_published_posts()
 
-class ContetnAuthorMixin(LoginRequiredMixin):
+
+class CachedObjectMixin:
+    '''Миксин, запоминающий объект на время обработки запроса.'''
+    def get_object(self, queryset=None):
+        if not hasattr(self, '_object'):
+            self._object = super().get_object(queryset)
+        return self._object
+
+
+class ContetnAuthorMixin(CachedObjectMixin, LoginRequiredMixin):
     '''Миксин проверки является ли пользователь автором.'''
     def dispatch(self, request, *args, **kwargs):
-        if self.get_object().author != request.user:
+        author_id = self.model.objects.filter(
+            pk=self.kwargs[self.pk_url_kwarg]
+        ).values_list('author_id', flat=True).first()
+        if author_id is None:
+            raise Http404
+        if author_id != request.user.id:
             return redirect(
                 'blog:post_detail',
                 post_id=self.kwargs['post_id']
@@ -53,18 +154,35 @@ class ContetnAuthorMixin(LoginRequiredMixin):
         return super().dispatch(request, *args, **kwargs)
 
 
-class PostDetailView(DetailView):
+class PostDetailView(CachedObjectMixin, DetailView):
     '''CBV для подробной страницы поста.'''
     model = Post
     template_name = 'blog/detail.html'
     pk_url_kwarg = 'post_id'
 
+    def get_queryset(self):
+        return Post.objects.select_related(
+            'author',
+            'location',
+            'category',
+        ).prefetch_related(
+            Prefetch(
+                'comments',
+                queryset=Comment.objects.select_related(
+                    'author'
+                ).order_by('created_at'),
+            )
+        )
+
     def dispatch(self, request, *args, **kwargs):
-        self.object = self.get_object()
-        if self.object.author != self.request.user and (
-            not self.object.category.is_published
-            or not self.object.is_published
-            or self.object.pub_date > timezone.now()
+        posts = Post.objects.filter(pk=self.kwargs[self.pk_url_kwarg])
+        if not posts.filter(
+            is_published=True,
+            category__is_published=True,
+            pub_date__lte=timezone.now(),
+        ).exists() and (
+            posts.values_list('author_id', flat=True).first()
+            != request.user.id
         ):
             raise Http404
         return super().dispatch(request, *args, **kwargs)
@@ -72,13 +190,16 @@ class PostDetailView(DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
-        context['comments'] = self.object.comments.select_related(
-            'author'
-        )
+        context['comments'] = self.object.comments.all()
         return context
 
 
-class CategoryListView(ListView):
+class CategoryListView(
+    AnonymousCacheMixin,
+    CachedCountMixin,
+    PostCardsCacheMixin,
+    ListView,
+):
     '''CBV для страницы категории поста.'''
     paginate_by = POSTS_COUNT
     template_name = 'blog/category.html'
@@ -149,7 +270,6 @@ class PostUpdateView(
 class PostDeleteView(
     ContetnAuthorMixin,
     ProfileRedirectMixin,
-    ValidationMixin,
     DeleteView,
 ):
     '''CBV для удаления поста.'''
@@ -163,7 +283,7 @@ class PostDeleteView(
         return context
 
 
-class ProfileListView(ListView):
+class ProfileListView(CachedCountMixin, PostCardsCacheMixin, ListView):
     '''CBV для страницы профиля.'''
     template_name = 'blog/profile.html'
     model = Post
@@ -171,7 +291,15 @@ class ProfileListView(ListView):
 
     def get_queryset(self):
         self.author = get_object_or_404(
-            User,
+            User.objects.only(
+                'id',
+                'username',
+                'first_name',
+                'last_name',
+                'email',
+                'date_joined',
+                'is_staff',
+            ),
             username=self.kwargs['username']
         )
         return get_ordered_posts_comments_count().filter(author=self.author)
@@ -211,7 +339,11 @@ class CommentCreateView(LoginRequiredMixin, CommentMixin, CreateView):
     def form_valid(self, form):
         form.instance.author = self.request.user
         form.instance.post = get_object_or_404(
-            get_published_posts(),
+            Post.objects.filter(
+                is_published=True,
+                category__is_published=True,
+                pub_date__lte=timezone.now(),
+            ).only('id'),
             pk=self.kwargs['post_id']
         )
         return super().form_valid(form)
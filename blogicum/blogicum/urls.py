@@ -27,3 +27,6 @@ urlpatterns = [
 if settings.DEBUG:
     import debug_toolbar
     urlpatterns += (path('__debug__/', include(debug_toolbar.urls)),)
+
+if 'silk' in settings.INSTALLED_APPS:
+    urlpatterns += (path('silk/', include('silk.urls', namespace='silk')),)
@@ -1,17 +1,26 @@
+from django.http import HttpResponse
+from django.template.loader import get_template
 from django.views.generic.base import TemplateView
-from django.shortcuts import render
+
+NOT_FOUND_TEMPLATE = get_template('pages/404.html')
+SERVER_ERROR_TEMPLATE = get_template('pages/500.html')
+CSRF_FAILURE_TEMPLATE = get_template('pages/403csrf.html')
 
 
 def page_not_found(request, exception):
-    return render(request, 'pages/404.html', status=404)
+    return HttpResponse(NOT_FOUND_TEMPLATE.render(request=request), status=404)
 
 
 def server_error(request, reason=''):
-    return render(request, 'pages/500.html', status=500)
+    return HttpResponse(
+        SERVER_ERROR_TEMPLATE.render(request=request), status=500
+    )
 
 
 def csrf_failure(request, reason=''):
-    return render(request, 'pages/403csrf.html', status=403)
+    return HttpResponse(
+        CSRF_FAILURE_TEMPLATE.render(request=request), status=403
+    )
 
 
 class AboutPage(TemplateView):
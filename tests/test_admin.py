@@ -0,0 +1,83 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from mixer.main import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture
+def admin_posts(mixer: Mixer, user, published_category):
+    return mixer.cycle(3).blend(
+        "blog.Post", author=user, category=published_category
+    )
+
+
+def post_list_selects(queries):
+    return [
+        query["sql"] for query in queries
+        if query["sql"].startswith('SELECT "blog_post"."id"')
+    ]
+
+
+def test_changelist_loads_only_displayed_fields(admin_client, admin_posts):
+    with CaptureQueriesContext(connection) as ctx:
+        response = admin_client.get("/admin/blog/post/")
+    assert response.status_code == 200
+    selects = post_list_selects(ctx.captured_queries)
+    assert selects, "Список публикаций в админке не загружает публикации."
+    for sql in selects:
+        assert '"blog_post"."text"' not in sql, (
+            "Убедитесь, что список публикаций в админке загружает только"
+            " отображаемые поля."
+        )
+
+
+def test_change_form_loads_full_post(admin_client, admin_posts):
+    post = admin_posts[0]
+    with CaptureQueriesContext(connection) as ctx:
+        response = admin_client.get(f"/admin/blog/post/{post.id}/change/")
+    assert response.status_code == 200
+    assert any(
+        '"blog_post"."text"' in sql
+        for sql in post_list_selects(ctx.captured_queries)
+    )
+
+
+def test_changelist_list_editable_save(admin_client, admin_posts):
+    post = admin_posts[0]
+    assert post.is_published
+    response = admin_client.post(
+        "/admin/blog/post/",
+        {
+            "form-TOTAL_FORMS": "1",
+            "form-INITIAL_FORMS": "1",
+            "form-MIN_NUM_FORMS": "0",
+            "form-MAX_NUM_FORMS": "1000",
+            "form-0-id": str(post.id),
+            "_save": "Сохранить",
+        },
+    )
+    assert response.status_code == 302
+    post.refresh_from_db()
+    assert not post.is_published, (
+        "Убедитесь, что в списке публикаций в админке можно снять"
+        " публикацию с публикации."
+    )
+
+
+def test_deferred_post_save_skips_image_sync(admin_posts):
+    from blog.models import Post
+
+    post = Post.objects.only("id", "title", "is_published").get(
+        pk=admin_posts[0].pk
+    )
+    post.is_published = False
+    with CaptureQueriesContext(connection) as ctx:
+        post.save()
+    assert all(
+        query["sql"].startswith("UPDATE") for query in ctx.captured_queries
+    ), (
+        "Убедитесь, что сохранение публикации с отложенными полями не"
+        " загружает их из базы данных."
+    )
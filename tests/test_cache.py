@@ -0,0 +1,97 @@
+import pytest
+from django.core.cache import cache
+from django.db.models import Model
+from django.test.client import Client
+
+pytestmark = [pytest.mark.django_db]
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_anonymous_cache_ignores_extra_params(
+    client: Client,
+    post_with_published_location,
+    django_assert_num_queries,
+):
+    client.get("/")
+    with django_assert_num_queries(0):
+        client.get("/?x=1")
+    with django_assert_num_queries(0):
+        client.get("/?page=1&x=2")
+
+
+def test_anonymous_cache_reset_on_author_rename(
+    client: Client, user: Model, post_with_published_location
+):
+    old_username = user.username
+    assert f"@{old_username}" in client.get("/").content.decode("utf-8")
+
+    user.username = f"{old_username}-renamed"
+    user.save()
+
+    content = client.get("/").content.decode("utf-8")
+    assert f"@{user.username}" in content, (
+        "Убедитесь, что после изменения имени автора кэш главной страницы"
+        " сбрасывается."
+    )
+
+
+def test_cache_version_does_not_repeat_after_eviction():
+    from blog.caching import (
+        POSTS_CACHE_VERSION_KEY,
+        get_posts_cache_version,
+        invalidate_posts_cache,
+    )
+
+    old_version = get_posts_cache_version()
+    invalidate_posts_cache()
+    cache.delete(POSTS_CACHE_VERSION_KEY)
+    assert get_posts_cache_version() > old_version + 1, (
+        "Убедитесь, что после вытеснения ключа версии кэша новая версия"
+        " не совпадает с уже использованными."
+    )
+    cache.delete(POSTS_CACHE_VERSION_KEY)
+    invalidate_posts_cache()
+    assert get_posts_cache_version() > old_version + 1
+
+
+def test_post_card_reset_on_author_rename(
+    user_client: Client,
+    another_user_client: Client,
+    user: Model,
+    post_with_published_location,
+):
+    old_username = user.username
+    for client in (user_client, another_user_client):
+        content = client.get("/").content.decode("utf-8")
+        assert f"@{old_username}" in content
+
+    user.username = f"{old_username}-renamed"
+    user.save()
+
+    for client in (user_client, another_user_client):
+        content = client.get("/").content.decode("utf-8")
+        assert f"@{user.username}" in content, (
+            "Убедитесь, что после изменения имени автора карточка поста"
+            " на главной странице отрисовывается заново."
+        )
+        assert f"@{old_username}<" not in content
+
+
+def test_post_card_reset_on_new_comment(
+    mixer,
+    user_client: Client,
+    user: Model,
+    post_with_published_location,
+):
+    assert "Комментарии (0)" in user_client.get("/").content.decode("utf-8")
+    mixer.blend("blog.Comment", post=post_with_published_location, author=user)
+    assert "Комментарии (1)" in user_client.get("/").content.decode("utf-8"), (
+        "Убедитесь, что после добавления комментария карточка поста"
+        " отрисовывается заново."
+    )
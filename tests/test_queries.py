@@ -0,0 +1,62 @@
+import pytest
+from django.core.cache import cache
+from django.db.models import Model
+from django.test.client import Client
+from mixer.main import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+SESSION_QUERIES = 2
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def commented_posts(
+    mixer: Mixer, user: Model, many_posts_with_published_locations
+):
+    for post in many_posts_with_published_locations:
+        mixer.cycle(2).blend("blog.Comment", post=post, author=user)
+    return many_posts_with_published_locations
+
+
+@pytest.mark.parametrize(
+    "url_template, expected_queries",
+    [
+        ("/", 4),
+        ("/category/{category.slug}/", 5),
+        ("/profile/{user.username}/", 5),
+        ("/posts/{post.id}/", 3),
+    ],
+)
+def test_num_queries(
+    client: Client,
+    user_client: Client,
+    user: Model,
+    published_category: Model,
+    commented_posts,
+    django_assert_num_queries,
+    url_template: str,
+    expected_queries: int,
+):
+    url = url_template.format(
+        category=published_category, user=user, post=commented_posts[0]
+    )
+    with django_assert_num_queries(expected_queries):
+        client.get(url)
+    cache.clear()
+    with django_assert_num_queries(expected_queries + SESSION_QUERIES):
+        user_client.get(url)
+
+
+def test_cached_index_for_anonymous(
+    client: Client, commented_posts, django_assert_num_queries
+):
+    client.get("/")
+    with django_assert_num_queries(0):
+        client.get("/")
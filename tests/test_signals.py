@@ -0,0 +1,35 @@
+import pytest
+from django.db.models import Model
+from mixer.main import Mixer
+
+pytestmark = [pytest.mark.django_db]
+
+
+def test_comment_count_follows_comments(
+    mixer: Mixer, user: Model, post_with_published_location
+):
+    post = post_with_published_location
+    post.refresh_from_db()
+    assert post.comment_count == 0
+
+    comments = mixer.cycle(3).blend("blog.Comment", post=post, author=user)
+    post.refresh_from_db()
+    assert post.comment_count == 3, (
+        "Убедитесь, что при создании комментария увеличивается"
+        " `Post.comment_count`."
+    )
+
+    comments[0].text = "Исправленный текст"
+    comments[0].save()
+    post.refresh_from_db()
+    assert post.comment_count == 3, (
+        "Убедитесь, что редактирование комментария не меняет"
+        " `Post.comment_count`."
+    )
+
+    comments[0].delete()
+    post.refresh_from_db()
+    assert post.comment_count == 2, (
+        "Убедитесь, что при удалении комментария уменьшается"
+        " `Post.comment_count`."
+    )